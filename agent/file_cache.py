@@ -0,0 +1,113 @@
+"""
+File Cache
+JSON file-backed cache with per-entry expiry, shared across processes and restarts
+"""
+
+import functools
+import hashlib
+import os
+import re
+import tempfile
+import time
+from typing import Any, Callable, Optional
+
+import orjson
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache')
+
+# Symbols become directory names, so anything that isn't a plain ticker
+# (e.g. "../x" or an absolute path from a request) is never cached
+_SYMBOL_RE = re.compile(r'^[A-Z0-9.^=-]{1,10}$')
+
+
+class FileCache:
+    """Stores JSON values under {root}/{symbol}/{endpoint}-{key}.json with an expiry timestamp"""
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize the cache
+
+        Args:
+            root: Cache directory. Defaults to TRADING_AGENT_CACHE_DIR or <project>/.cache
+        """
+        self.root = root or os.getenv('TRADING_AGENT_CACHE_DIR', DEFAULT_CACHE_DIR)
+
+    @staticmethod
+    def make_key(endpoint: str, symbol: str, params: Optional[dict] = None) -> str:
+        """Build a stable MD5 key from (endpoint, symbol, params)"""
+        raw = orjson.dumps([endpoint, symbol, params or {}], option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.md5(raw).hexdigest()
+
+    def _path(self, endpoint: str, symbol: str, params: Optional[dict]) -> Optional[str]:
+        """Path of an entry, or None if the symbol isn't safe to use as a directory name"""
+        directory = symbol.upper()
+        if not _SYMBOL_RE.match(directory) or directory.strip('.') == '':
+            return None
+        return os.path.join(self.root, directory, f"{endpoint}-{self.make_key(endpoint, symbol, params)}.json")
+
+    def get(self, endpoint: str, symbol: str, params: Optional[dict] = None) -> Optional[Any]:
+        """
+        Read a cached value
+
+        Returns:
+            Cached value, or None if missing, expired or unreadable
+        """
+        path = self._path(endpoint, symbol, params)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                entry = orjson.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if entry.get('expires_at', 0) < time.time():
+            return None
+        return entry.get('value')
+
+    def set(self, endpoint: str, symbol: str, value: Any, ttl: float, params: Optional[dict] = None) -> None:
+        """Write a value that expires after ttl seconds (atomic replace, errors ignored)"""
+        path = self._path(endpoint, symbol, params)
+        if path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                # OPT_SERIALIZE_NUMPY accepts numpy scalars/arrays coming from yfinance
+                f.write(orjson.dumps(
+                    {'value': value, 'expires_at': time.time() + ttl},
+                    option=orjson.OPT_SERIALIZE_NUMPY
+                ))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error writing cache entry {path}: {e}")
+
+
+file_cache = FileCache()
+
+
+def cached(endpoint: str, ttl: float) -> Callable:
+    """
+    Decorator caching a `method(self, symbol, **params)` result on disk
+
+    None results are not cached so failed fetches are retried on the next call.
+
+    Args:
+        endpoint: Name of the cached endpoint (used in the file name and key)
+        ttl: Time to live in seconds
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, symbol: str, **params):
+            value = file_cache.get(endpoint, symbol, params)
+            if value is not None:
+                return value
+
+            value = func(self, symbol, **params)
+            if value is not None:
+                file_cache.set(endpoint, symbol, value, ttl, params)
+            return value
+        return wrapper
+    return decorator
@@ -3,32 +3,267 @@ Financial Data Service
 Fetches real-time stock data using yfinance and other free APIs
 """
 
-import yfinance as yf
-import requests
+# yfinance, numpy and the HTTP client libraries are imported where they're
+# used so importing this module (e.g. from app.py) stays cheap
+import asyncio
+import functools
+import string
+import threading
+from cachetools import TLRUCache
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Any
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from .file_cache import cached, file_cache
+from .rate_limiter import TokenBucket
+
+if TYPE_CHECKING:
+    import yfinance as yf
+
+# On-disk TTLs (seconds), aligned with how often each kind of data changes
+QUOTE_TTL = 900  # 15 minutes (price, volume and 52-week range share one history fetch)
+INFO_TTL = 86400  # 1 day (market cap / P/E move daily; sector and industry ride along)
+QUARTERLY_FINANCIALS_TTL = 90 * 86400  # 90 days, statements only change on earnings releases
+
+# ticker.info fields consumed by get_stock_data
+INFO_FIELDS = (
+    'marketCap', 'trailingPE', 'sharesOutstanding', 'trailingEps',
+    'earningsGrowth', 'revenueGrowth', 'sector', 'industry'
+)
+
+# quoteSummary modules holding INFO_FIELDS, fetched instead of the full ticker.info payload
+QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}"
+QUOTE_SUMMARY_MODULES = ('summaryDetail', 'defaultKeyStatistics', 'financialData', 'assetProfile')
+YAHOO_COOKIE_URL = "https://fc.yahoo.com"
+YAHOO_CRUMB_URL = "https://query2.finance.yahoo.com/v1/test/getcrumb"
+
+# Request budgets per Yahoo endpoint family: chart (price history),
+# quoteSummary (info) and fundamentals-timeseries (income statements)
+RATE_LIMITS = {
+    'chart': TokenBucket(60, per=60),
+    'quote_summary': TokenBucket(10, per=60),
+    'fundamentals': TokenBucket(10, per=60)
+}
+
+# Watchlist warming runs one symbol at a time and at most this many cold
+# symbols per minute (1-2 quoteSummary requests each), so it never takes
+# more than about half of RATE_LIMITS and user lookups aren't starved
+WARM_CACHE_MAX_WORKERS = 1
+WARM_CACHE_RATE_LIMIT = TokenBucket(2, per=60)
+
+# Yahoo accepts roughly 10-20 symbols per multi-ticker request
+BATCH_CHUNK_SIZE = 10
+# info/financials have no batch endpoint and are fetched on a thread pool
+BATCH_MAX_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session():
+    """
+    Get the HTTP session shared by every yfinance call, creating it on first use
+    
+    Prefers curl_cffi with browser impersonation (what Yahoo's bot detection
+    expects); falls back to a pooled requests.Session that retries 429/5xx
+    with exponential backoff.
+    """
+    try:
+        from curl_cffi import requests as curl_requests
+        return curl_requests.Session(impersonate="chrome")
+    except ImportError:
+        pass
+    
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    retry_strategy = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=retry_strategy)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_crumb: Optional[str] = None
+_crumb_lock = threading.Lock()
+
+
+def _get_crumb(refresh: bool = False) -> str:
+    """Get the Yahoo crumb that authenticates direct quoteSummary calls on the shared session"""
+    global _crumb
+    with _crumb_lock:
+        if _crumb is None or refresh:
+            try:
+                # Only sets the session cookie; the page itself is a 404
+                _get_session().get(YAHOO_COOKIE_URL, timeout=10)
+            except Exception:
+                pass
+            response = _get_session().get(YAHOO_CRUMB_URL, timeout=10)
+            response.raise_for_status()
+            _crumb = response.text.strip()
+        return _crumb
+
+
+# Worker threads backing the async helpers (yfinance itself is sync-only)
+ASYNC_MAX_WORKERS = 16
+_async_executor = ThreadPoolExecutor(max_workers=ASYNC_MAX_WORKERS, thread_name_prefix='stock-data')
+
+@functools.lru_cache(maxsize=1024)
+def _ticker(symbol: str, session_id: int, generation: int) -> "yf.Ticker":
+    """
+    Memoized yf.Ticker construction (scraper, cookies and crumb set up once)
+    
+    session_id invalidates entries when the shared session is replaced;
+    generation rolls over every QUOTE_TTL since Ticker memoizes .info and
+    statements on the instance.
+    """
+    import yfinance as yf
+    return yf.Ticker(symbol, session=_get_session())
+
+
+def _get_ticker(symbol: str) -> "yf.Ticker":
+    """Get the shared yf.Ticker for a symbol"""
+    return _ticker(symbol, id(_get_session()), int(time.time() // QUOTE_TTL))
+
+
+def _or_na(value: Any, fmt: str = "{}") -> str:
+    """Format a value for display, or 'N/A' when it is missing"""
+    return fmt.format(value) if value not in (None, '') else 'N/A'
+
+
+def _summarize_history(hist) -> Optional[Dict[str, Any]]:
+    """Price, volume and 52-week range from a year of daily OHLCV history, stamped with the fetch time"""
+    import numpy as np
+    
+    if hist.empty:
+        return None
+    
+    # Work on the raw arrays to skip pandas' label-based indexing per lookup
+    closes = hist['Close'].to_numpy()
+    volumes = hist['Volume'].to_numpy()
+    
+    return {
+        "current_price": float(closes[-1]),
+        "volume": float(volumes[-1]),
+        "avg_volume_20d": float(np.nanmean(volumes[-20:])),
+        "52_week_high": float(np.nanmax(hist['High'].to_numpy())),
+        "52_week_low": float(np.nanmin(hist['Low'].to_numpy())),
+        "fetched_at": time.time()
+    }
+
+
+def _summarize_histories(hists: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Batch version of _summarize_history for non-empty histories
+    
+    Stacks the histories into one right-aligned, NaN-padded OHLCV tensor and
+    reduces it in a single (Numba-compiled when available) pass.
+    """
+    import numpy as np
+    from .ohlcv_kernels import OHLCV_COLUMNS, aggregate_ohlcv
+    
+    if not hists:
+        return []
+    
+    fetched_at = time.time()
+    n_days = max(len(hist) for hist in hists)
+    ohlcv = np.full((len(hists), n_days, len(OHLCV_COLUMNS)), np.nan)
+    for i, hist in enumerate(hists):
+        ohlcv[i, n_days - len(hist):] = hist[OHLCV_COLUMNS].to_numpy(dtype=np.float64)
+    
+    return [
+        {
+            "current_price": float(current_price),
+            "volume": float(volume),
+            "avg_volume_20d": float(avg_volume_20d),
+            "52_week_high": float(week_52_high),
+            "52_week_low": float(week_52_low),
+            "fetched_at": fetched_at
+        }
+        for current_price, volume, avg_volume_20d, week_52_high, week_52_low in aggregate_ohlcv(ohlcv)
+    ]
 
 
 class FinancialDataService:
     """Service to fetch real-time financial data with caching"""
     
+    # Process-wide cache shared by all instances, bounded size. Entries are
+    # (stock_data, expires_at) and expire with the quote they were built from,
+    # which may already have spent part of QUOTE_TTL in the file cache
+    cache_ttl = 900  # 15 minutes in seconds
+    _cache = TLRUCache(maxsize=4096, ttu=lambda _symbol, entry, _now: entry[1], timer=time.time)
+    _cache_lock = threading.RLock()
+    
+    # Fetches currently in progress, keyed by (operation, symbol), so concurrent
+    # misses on the same symbol share a single upstream request
+    _inflight: Dict[tuple, Future] = {}
+    _inflight_lock = threading.Lock()
+    
+    # Compiled once; every optional field is pre-formatted (or 'N/A') before substitution
+    _llm_template = string.Template("""
+LIVE MARKET DATA FOR $symbol (Updated: $last_updated):
+
+PRICE DATA:
+- Current Price: $current_price
+- 52-Week Range: $week_52_low - $week_52_high
+
+VOLUME ANALYSIS:
+- Current Volume: $volume
+- 20-Day Average Volume: $avg_volume_20d
+- Volume Ratio: $volume_ratio_pct% of 20-day average
+
+FUNDAMENTAL DATA:
+- Market Cap: $market_cap
+- P/E Ratio: $pe_ratio
+- Sector: $sector
+- Industry: $industry
+
+EARNINGS DATA:
+- Latest Earnings: $latest_earnings
+- YoY Earnings Growth: $earnings_growth_yoy
+- Last Earnings Date: $earnings_date
+""".strip())
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        # Simple in-memory cache with 15-minute TTL
-        self.cache = {}
-        self.cache_ttl = 900  # 15 minutes in seconds
+        self.session = _get_session()
     
     def _is_cache_valid(self, symbol: str) -> bool:
-        """Check if cached data is still valid"""
-        if symbol not in self.cache:
-            return False
+        """Check if cached data is still valid (TLRUCache drops expired entries)"""
+        with self._cache_lock:
+            return symbol in self._cache
+    
+    def _coalesce(self, op: str, symbol: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Run fetch() unless the same (op, symbol) fetch is already in flight,
+        in which case wait for and return that fetch's result
+        """
+        key = (op, symbol)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
         
-        cache_time = self.cache[symbol].get('cached_at', 0)
-        return time.time() - cache_time < self.cache_ttl
+        if not is_owner:
+            return future.result()
+        
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
     
     def get_stock_data(self, symbol: str) -> Dict[str, Any]:
         """
@@ -41,32 +276,30 @@ class FinancialDataService:
             Dictionary with current price, volume, earnings, etc.
         """
         # Check cache first
-        if self._is_cache_valid(symbol):
-            cached_data = self.cache[symbol].copy()
-            cached_data.pop('cached_at', None)  # Remove cache metadata
-            cached_data['from_cache'] = True
-            return cached_data
+        with self._cache_lock:
+            cached_entry = self._cache.get(symbol)
+        if cached_entry is not None:
+            # Build the response in one merge; the cached dict itself is never mutated
+            return cached_entry[0] | {'from_cache': True}
         
+        return self._coalesce('stock_data', symbol, lambda: self._fetch_stock_data(symbol))
+    
+    def _fetch_stock_data(self, symbol: str) -> Dict[str, Any]:
+        """Fetch, assemble and cache stock data for a symbol (cache miss path of get_stock_data)"""
         try:
-            ticker = yf.Ticker(symbol)
-            
-            # Get basic info
-            info = ticker.info
-            
-            # Get recent price data (last 30 days for volume analysis)
-            hist = ticker.history(period="1mo")
+            info = self._get_info(symbol) or {}
+            quote = self._get_quote(symbol)
             
-            if hist.empty:
+            if quote is None:
                 return {"error": f"No data available for {symbol}"}
             
-            current_price = hist['Close'].iloc[-1]
-            current_volume = hist['Volume'].iloc[-1]
-            avg_volume_20d = hist['Volume'].tail(20).mean()
-            
-            # Calculate 52-week range
-            year_hist = ticker.history(period="1y")
-            week_52_high = year_hist['High'].max() if not year_hist.empty else None
-            week_52_low = year_hist['Low'].min() if not year_hist.empty else None
+            # Quotes cached before fetched_at was recorded are at most QUOTE_TTL old
+            fetched_at = quote.get('fetched_at') or time.time()
+            current_price = quote['current_price']
+            current_volume = quote['volume']
+            avg_volume_20d = quote['avg_volume_20d']
+            week_52_high = quote['52_week_high']
+            week_52_low = quote['52_week_low']
             
             # Volume ratio
             volume_ratio = (current_volume / avg_volume_20d * 100) if avg_volume_20d > 0 else 0
@@ -74,13 +307,12 @@ class FinancialDataService:
             # Get quarterly EPS
             quarterly_eps = None
             try:
-                quarterly_financials = ticker.quarterly_financials
-                if not quarterly_financials.empty and 'Net Income' in quarterly_financials.index:
-                    # Get shares outstanding
-                    shares = info.get('sharesOutstanding')
-                    if shares:
-                        latest_net_income = quarterly_financials.loc['Net Income'].iloc[0]
-                        quarterly_eps = round((latest_net_income / shares), 2)
+                financials = self._get_quarterly_financials(symbol)
+                net_income = financials['net_income'] if financials else []
+                # Get shares outstanding
+                shares = info.get('sharesOutstanding')
+                if net_income and shares:
+                    quarterly_eps = round((net_income[0] / shares), 2)
             except:
                 # Fallback to basic EPS from info
                 quarterly_eps = info.get('trailingEps')
@@ -100,48 +332,226 @@ class FinancialDataService:
                 "revenue_growth": info.get('revenueGrowth'),
                 "sector": info.get('sector'),
                 "industry": info.get('industry'),
-                "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "last_updated": datetime.fromtimestamp(fetched_at).isoformat(sep=' ', timespec='seconds'),
                 "from_cache": False
             }
             
-            # Cache the data
-            cache_data = stock_data.copy()
-            cache_data['cached_at'] = time.time()
-            self.cache[symbol] = cache_data
+            # Cache the data until the underlying quote expires
+            expires_at = min(fetched_at + QUOTE_TTL, time.time() + self.cache_ttl)
+            with self._cache_lock:
+                self._cache[symbol] = (stock_data, expires_at)
             
             return stock_data
             
         except Exception as e:
             return {"error": f"Failed to fetch data for {symbol}: {str(e)}"}
     
+    @cached('price_history', ttl=QUOTE_TTL)
+    def _get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Price, volume and 52-week range from a single year of daily history"""
+        RATE_LIMITS['chart'].acquire()
+        return _summarize_history(_get_ticker(symbol).history(period="1y"))
+    
+    @cached('quarterly_income_stmt', ttl=QUARTERLY_FINANCIALS_TTL)
+    def _get_quarterly_financials(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Quarterly net income and period end dates, most recent quarter first
+        
+        Returns None (not cached) when yfinance returns no statement, which it
+        also does on transient errors and rate limiting.
+        """
+        RATE_LIMITS['fundamentals'].acquire()
+        income_stmt = _get_ticker(symbol).quarterly_income_stmt
+        if income_stmt is None or income_stmt.empty or 'Net Income' not in income_stmt.index:
+            return None
+        
+        net_income_data = income_stmt.loc['Net Income'].dropna()
+        if net_income_data.empty:
+            return None
+        return {
+            "net_income": net_income_data.to_numpy(dtype=float).tolist(),
+            "dates": [d.strftime("%Y-%m-%d") if hasattr(d, 'strftime') else None for d in net_income_data.index]
+        }
+    
+    @cached('info', ttl=INFO_TTL)
+    def _get_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Valuation and profile fields (INFO_FIELDS) for a symbol
+        
+        Returns None (not cached) when none of the fields came back.
+        """
+        RATE_LIMITS['quote_summary'].acquire()
+        try:
+            info = self._fetch_quote_summary(symbol, QUOTE_SUMMARY_MODULES)
+        except Exception as e:
+            print(f"quoteSummary lookup failed for {symbol}, falling back to ticker.info: {e}")
+            RATE_LIMITS['quote_summary'].acquire()
+            info = _get_ticker(symbol).info
+        
+        fields = {field: info.get(field) for field in INFO_FIELDS}
+        if all(value is None for value in fields.values()):
+            return None
+        return fields
+    
+    def _fetch_quote_summary(self, symbol: str, modules: tuple) -> Dict[str, Any]:
+        """
+        Fetch selected quoteSummary modules in a single request
+        
+        Args:
+            symbol: Stock ticker symbol
+            modules: quoteSummary module names (e.g. 'summaryDetail')
+            
+        Returns:
+            Fields of all requested modules flattened into one dict of raw values,
+            using the same names as ticker.info
+        """
+        url = QUOTE_SUMMARY_URL.format(symbol=symbol)
+        params = {'modules': ','.join(modules), 'crumb': _get_crumb()}
+        
+        response = self.session.get(url, params=params, timeout=10)
+        if response.status_code == 401:
+            # Crumb expired - refresh once and retry
+            params['crumb'] = _get_crumb(refresh=True)
+            response = self.session.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        
+        results = response.json().get('quoteSummary', {}).get('result') or []
+        if not results:
+            raise ValueError(f"No quoteSummary data for {symbol}")
+        
+        fields = {}
+        for module in results[0].values():
+            if not isinstance(module, dict):
+                continue
+            for field, value in module.items():
+                # Numeric fields come as {"raw": 1.23, "fmt": "1.23"}; empty ones as {}
+                fields[field] = value.get('raw') if isinstance(value, dict) else value
+        return fields
+    
+    def get_stock_data_batch(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get stock data for several symbols, batching the price history requests
+        
+        Price histories for uncached symbols are downloaded in chunks with
+        yf.download; the per-symbol info/financials lookups run concurrently.
+        
+        Args:
+            symbols: Stock ticker symbols
+            
+        Returns:
+            Dictionary mapping each symbol to its get_stock_data result
+        """
+        symbols = list(dict.fromkeys(symbols))
+        missing = [symbol for symbol in symbols if not self._is_cache_valid(symbol)]
+        
+        for i in range(0, len(missing), BATCH_CHUNK_SIZE):
+            self._prefetch_price_history(missing[i:i + BATCH_CHUNK_SIZE])
+        
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+            return dict(zip(symbols, executor.map(self.get_stock_data, symbols)))
+    
+    def warm_cache(self, symbols: List[str], max_workers: int = WARM_CACHE_MAX_WORKERS) -> int:
+        """
+        Pre-fetch stock data for a watchlist so first queries are cache hits
+        
+        Runs in the background alongside user requests, so symbols that aren't
+        already cached are paced by WARM_CACHE_RATE_LIMIT on top of RATE_LIMITS.
+        
+        Args:
+            symbols: Stock ticker symbols to warm
+            max_workers: Maximum number of concurrent fetches
+            
+        Returns:
+            Number of symbols successfully cached
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return 0
+        
+        warmed = 0
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+            futures = {executor.submit(self._warm_symbol, symbol): symbol for symbol in symbols}
+            for future in as_completed(futures):
+                try:
+                    if "error" not in future.result():
+                        warmed += 1
+                except Exception as e:
+                    print(f"Error warming cache for {futures[future]}: {e}")
+        return warmed
+    
+    def _warm_symbol(self, symbol: str) -> Dict[str, Any]:
+        """get_stock_data for warm_cache, waiting for the warming budget on a cache miss"""
+        if not self._is_cache_valid(symbol):
+            WARM_CACHE_RATE_LIMIT.acquire()
+        return self.get_stock_data(symbol)
+    
+    def _prefetch_price_history(self, symbols: List[str]) -> None:
+        """Download a year of history for up to BATCH_CHUNK_SIZE symbols in one request and cache it"""
+        symbols = [symbol for symbol in symbols if file_cache.get('price_history', symbol) is None]
+        if not symbols:
+            return
+        
+        import yfinance as yf
+        
+        # yf.download issues one chart request per symbol
+        RATE_LIMITS['chart'].acquire(len(symbols))
+        try:
+            data = yf.download(
+                tickers=" ".join(symbols),
+                period="1y",
+                # Match Ticker.history's adjusted prices; both fill 'price_history'
+                auto_adjust=True,
+                group_by='ticker',
+                threads=True,
+                progress=False,
+                session=self.session
+            )
+        except Exception as e:
+            # get_stock_data falls back to fetching each symbol on its own
+            print(f"Error downloading price history for {', '.join(symbols)}: {e}")
+            return
+        
+        grouped = data.columns.nlevels > 1
+        hists = {}
+        for symbol in symbols:
+            if grouped and symbol not in data.columns.get_level_values(0):
+                continue
+            hist = (data[symbol] if grouped else data).dropna(how='all')
+            if not hist.empty:
+                hists[symbol] = hist
+        
+        for symbol, summary in zip(hists, _summarize_histories(list(hists.values()))):
+            file_cache.set('price_history', symbol, summary, QUOTE_TTL)
+    
     def get_earnings_data(self, symbol: str) -> Dict[str, Any]:
         """Get latest earnings data for a stock"""
+        return self._coalesce('earnings', symbol, lambda: self._fetch_earnings_data(symbol))
+    
+    def _fetch_earnings_data(self, symbol: str) -> Dict[str, Any]:
+        """Fetch latest earnings data for a stock (see get_earnings_data)"""
         try:
-            ticker = yf.Ticker(symbol)
-            
             # Use income statement instead of deprecated earnings
             try:
-                income_stmt = ticker.quarterly_income_stmt
-                if income_stmt is not None and not income_stmt.empty and 'Net Income' in income_stmt.index:
-                    net_income_data = income_stmt.loc['Net Income'].dropna()
-                    if len(net_income_data) >= 2:
-                        latest_earnings = net_income_data.iloc[0] / 1e9  # Convert to billions
-                        prev_earnings = net_income_data.iloc[1] / 1e9
-                        
-                        earnings_growth = None
-                        if prev_earnings != 0:
-                            earnings_growth = ((latest_earnings - prev_earnings) / abs(prev_earnings)) * 100
-                        
-                        return {
-                            "latest_earnings": round(latest_earnings, 2),
-                            "earnings_growth_yoy": round(earnings_growth, 1) if earnings_growth else None,
-                            "earnings_date": net_income_data.index[0].strftime("%Y-%m-%d") if hasattr(net_income_data.index[0], 'strftime') else "Recent"
-                        }
+                financials = self._get_quarterly_financials(symbol)
+                net_income_data = financials['net_income'] if financials else []
+                if len(net_income_data) >= 2:
+                    latest_earnings = net_income_data[0] / 1e9  # Convert to billions
+                    prev_earnings = net_income_data[1] / 1e9
+                    
+                    earnings_growth = None
+                    if prev_earnings != 0:
+                        earnings_growth = ((latest_earnings - prev_earnings) / abs(prev_earnings)) * 100
+                    
+                    return {
+                        "latest_earnings": round(latest_earnings, 2),
+                        "earnings_growth_yoy": round(earnings_growth, 1) if earnings_growth else None,
+                        "earnings_date": financials['dates'][0] or "Recent"
+                    }
             except:
                 pass
             
-            # Fallback to basic info
-            info = ticker.info
+            # Fallback to the info already fetched for get_stock_data
+            info = self._get_info(symbol) or {}
             return {
                 "latest_earnings": info.get('trailingEps'),
                 "earnings_growth_yoy": round(info.get('earningsGrowth', 0) * 100, 1) if info.get('earningsGrowth') else None,
@@ -210,37 +620,50 @@ class FinancialDataService:
         earnings_data = self.get_earnings_data(symbol)
         
         # Format the data
-        formatted_data = f"""
-LIVE MARKET DATA FOR {symbol} (Updated: {stock_data['last_updated']}):
-
-PRICE DATA:
-- Current Price: ${stock_data['current_price']}
-- 52-Week Range: ${stock_data['52_week_low']} - ${stock_data['52_week_high']}
-
-VOLUME ANALYSIS:
-- Current Volume: {stock_data['volume']:,}
-- 20-Day Average Volume: {stock_data['avg_volume_20d']:,}
-- Volume Ratio: {stock_data['volume_ratio_pct']}% of 20-day average
-
-FUNDAMENTAL DATA:
-- Market Cap: ${stock_data['market_cap']:,} if stock_data['market_cap'] else 'N/A'
-- P/E Ratio: {stock_data['pe_ratio']} if stock_data['pe_ratio'] else 'N/A'
-- Sector: {stock_data['sector'] or 'N/A'}
-- Industry: {stock_data['industry'] or 'N/A'}
-
-EARNINGS DATA:
-- Latest Earnings: ${earnings_data.get('latest_earnings', 'N/A')} per share
-- YoY Earnings Growth: {earnings_data.get('earnings_growth_yoy', 'N/A')}%
-- Last Earnings Date: {earnings_data.get('earnings_date', 'N/A')}
-"""
+        formatted_data = self._llm_template.substitute(
+            symbol=symbol,
+            last_updated=stock_data['last_updated'],
+            current_price=_or_na(stock_data['current_price'], "${}"),
+            week_52_low=_or_na(stock_data['52_week_low'], "${}"),
+            week_52_high=_or_na(stock_data['52_week_high'], "${}"),
+            volume=f"{stock_data['volume']:,}",
+            avg_volume_20d=f"{stock_data['avg_volume_20d']:,}",
+            volume_ratio_pct=stock_data['volume_ratio_pct'],
+            market_cap=_or_na(stock_data['market_cap'], "${:,}"),
+            pe_ratio=_or_na(stock_data['pe_ratio']),
+            sector=_or_na(stock_data['sector']),
+            industry=_or_na(stock_data['industry']),
+            latest_earnings=_or_na(earnings_data.get('latest_earnings'), "${} per share"),
+            earnings_growth_yoy=_or_na(earnings_data.get('earnings_growth_yoy'), "{}%"),
+            earnings_date=_or_na(earnings_data.get('earnings_date'))
+        )
         
         return {
             "success": True,
-            "data": formatted_data.strip(),
+            "data": formatted_data,
             "symbol": symbol
         }
 
 
+_default_service: Optional[FinancialDataService] = None
+_default_service_lock = threading.Lock()
+
+
+def get_default_service() -> FinancialDataService:
+    """
+    Get the shared module-level FinancialDataService, creating it on first use
+    
+    Returns:
+        Process-wide FinancialDataService instance
+    """
+    global _default_service
+    if _default_service is None:
+        with _default_service_lock:
+            if _default_service is None:
+                _default_service = FinancialDataService()
+    return _default_service
+
+
 def get_live_stock_data(symbol: str) -> Dict[str, Any]:
     """
     Convenience function to get formatted stock data
@@ -251,8 +674,46 @@ def get_live_stock_data(symbol: str) -> Dict[str, Any]:
     Returns:
         Dictionary with success status and data or error
     """
-    service = FinancialDataService()
-    return service.format_for_llm(symbol)
+    return get_default_service().format_for_llm(symbol)
+
+
+async def get_live_stock_data_async(symbol: str) -> Dict[str, Any]:
+    """
+    Async version of get_live_stock_data that doesn't block the event loop
+    
+    Args:
+        symbol: Stock ticker symbol
+        
+    Returns:
+        Dictionary with success status and data or error
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_async_executor, get_live_stock_data, symbol)
+
+
+async def get_live_stock_data_many(symbols: List[str], max_concurrency: int = ASYNC_MAX_WORKERS) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch formatted stock data for several symbols concurrently
+    
+    Requests still go through the shared rate limiter, so fan-out is paced
+    to Yahoo's budget rather than fired all at once.
+    
+    Args:
+        symbols: Stock ticker symbols
+        max_concurrency: Maximum number of fetches in flight at once
+        
+    Returns:
+        Dictionary mapping each symbol to its get_live_stock_data result
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def fetch(symbol: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await get_live_stock_data_async(symbol)
+    
+    symbols = list(dict.fromkeys(symbols))
+    results = await asyncio.gather(*(fetch(symbol) for symbol in symbols))
+    return dict(zip(symbols, results))
 
 
 if __name__ == "__main__":
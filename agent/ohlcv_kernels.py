@@ -0,0 +1,88 @@
+"""
+OHLCV Kernels
+Numeric reductions over stacked price histories for batch requests
+
+Compiled with Numba when it is installed (optional dependency); otherwise the
+same reductions run as vectorized NumPy along the day axis.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+# Column order of the stacked tensor
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+HIGH, LOW, CLOSE, VOLUME = 1, 2, 3, 4
+
+
+def _aggregate_ohlcv_loops(ohlcv):
+    """
+    Reduce a (n_symbols, n_days, 5) OHLCV tensor to per-symbol summary stats
+
+    Histories are right-aligned (latest day last) and left-padded with NaN;
+    NaN values are skipped like pandas' skipna reductions. Only worth running
+    compiled; see aggregate_ohlcv.
+
+    Returns:
+        (n_symbols, 5) array of current price, current volume,
+        20-day average volume, 52-week high and 52-week low
+    """
+    n_symbols, n_days = ohlcv.shape[0], ohlcv.shape[1]
+    out = np.empty((n_symbols, 5))
+
+    for i in prange(n_symbols):
+        last = n_days - 1
+        out[i, 0] = ohlcv[i, last, CLOSE]
+        out[i, 1] = ohlcv[i, last, VOLUME]
+
+        volume_sum = 0.0
+        volume_count = 0
+        for d in range(max(0, n_days - 20), n_days):
+            volume = ohlcv[i, d, VOLUME]
+            if not np.isnan(volume):
+                volume_sum += volume
+                volume_count += 1
+        out[i, 2] = volume_sum / volume_count if volume_count else np.nan
+
+        high = -np.inf
+        low = np.inf
+        for d in range(n_days):
+            if ohlcv[i, d, HIGH] > high:
+                high = ohlcv[i, d, HIGH]
+            if ohlcv[i, d, LOW] < low:
+                low = ohlcv[i, d, LOW]
+        out[i, 3] = high
+        out[i, 4] = low
+
+    return out
+
+
+def _aggregate_ohlcv_numpy(ohlcv):
+    """Vectorized equivalent of _aggregate_ohlcv_loops (same NaN handling, no warnings)"""
+    out = np.empty((ohlcv.shape[0], 5))
+    out[:, 0] = ohlcv[:, -1, CLOSE]
+    out[:, 1] = ohlcv[:, -1, VOLUME]
+
+    volumes = ohlcv[:, -20:, VOLUME]
+    volume_count = np.count_nonzero(~np.isnan(volumes), axis=1)
+    volume_sum = np.nansum(volumes, axis=1)
+    out[:, 2] = np.where(volume_count > 0, volume_sum / np.maximum(volume_count, 1), np.nan)
+
+    # fmax/fmin skip NaN; all-NaN rows give -inf/inf like the loops
+    out[:, 3] = np.fmax.reduce(ohlcv[:, :, HIGH], axis=1, initial=-np.inf)
+    out[:, 4] = np.fmin.reduce(ohlcv[:, :, LOW], axis=1, initial=np.inf)
+
+    return out
+
+
+# Per-symbol loops are only fast compiled; interpreted, they index NumPy one
+# element at a time, so use the vectorized reductions instead
+if njit is not None:
+    aggregate_ohlcv = njit(parallel=True, cache=True)(_aggregate_ohlcv_loops)
+else:
+    aggregate_ohlcv = _aggregate_ohlcv_numpy
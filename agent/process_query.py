@@ -1,13 +1,29 @@
-import requests
-import anthropic
+import functools
 import os
+from typing import Iterator
 
-client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"),)
 
+@functools.lru_cache(maxsize=None)
+def _get_client():
+    """Create the Anthropic client on first use (anthropic is slow to import)"""
+    import anthropic
+    import httpx
+    
+    # One pooled HTTP/2 connection set reused by every call
+    return anthropic.Anthropic(
+        api_key=os.getenv("ANTHROPIC_API_KEY"),
+        http_client=httpx.Client(http2=True, limits=httpx.Limits(max_connections=10)),
+    )
+
+
+@functools.lru_cache(maxsize=512)
 def call_claude(prompt: str, model="claude-sonnet-4-20250514", max_tokens=1024) -> str:
     """
     Call Claude API with a given prompt.
 
+    Responses are memoized per (prompt, model, max_tokens), so retries of
+    an identical request are served locally.
+
     Args:
         prompt (str): Input text to send to Claude.
         model (str): Claude model name.
@@ -17,9 +33,29 @@ def call_claude(prompt: str, model="claude-sonnet-4-20250514", max_tokens=1024)
         str: Claude's response text.
     """
 
-    message = client.messages.create(
+    message = _get_client().messages.create(
         model=model,
         max_tokens=max_tokens,
-        messages=[{"role": "user", "content": "Hello, Claude"}])
+        messages=[{"role": "user", "content": prompt}])
     
-    print(message)
\ No newline at end of file
+    return message.content[0].text if message.content else ""
+
+
+def stream_claude(prompt: str, model="claude-sonnet-4-20250514", max_tokens=1024) -> Iterator[str]:
+    """
+    Stream Claude's response to a prompt as it is generated.
+
+    Args:
+        prompt (str): Input text to send to Claude.
+        model (str): Claude model name.
+        max_tokens (int): Maximum tokens to generate.
+
+    Yields:
+        str: Chunks of Claude's response text, in order.
+    """
+
+    with _get_client().messages.stream(
+        model=model,
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": prompt}]) as stream:
+        yield from stream.text_stream
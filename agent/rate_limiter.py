@@ -0,0 +1,41 @@
+"""
+Rate Limiter
+Thread-safe token bucket used to pace upstream API requests
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Allows `rate` requests per `per` seconds, refilling continuously"""
+
+    def __init__(self, rate: float, per: float = 60.0):
+        """
+        Initialize a full bucket
+
+        Args:
+            rate: Number of requests allowed per window (also the burst size)
+            per: Window length in seconds
+        """
+        self.capacity = float(rate)
+        self.fill_rate = rate / per
+        self.tokens = float(rate)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Block until `tokens` requests may be made, then consume them"""
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.fill_rate)
+                self.updated_at = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.fill_rate
+
+            time.sleep(wait)
@@ -8,96 +8,111 @@ Author: Claude
 Date: 2025-08-23
 """
 
-import json
+import asyncio
+import functools
+import os
 import time
 import re
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, Final, List, Optional, Any, Union
 from dataclasses import dataclass
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import httpx
+import orjson
+from cachetools import TTLCache
 from .financial_data import get_live_stock_data
 
+# Successful get_live_stock_data results by uppercased symbol, reused across chat requests
+LIVE_DATA_CACHE_TTL = 60  # seconds
+_live_data_cache = TTLCache(maxsize=512, ttl=LIVE_DATA_CACHE_TTL)
+_live_data_cache_lock = threading.Lock()
 
-@dataclass
-class ZangerResearchPlan:
-    """Structured data class for Zanger research plan output"""
-    technical_pattern_analysis: List[str]
-    volume_verification: List[str]
-    zanger_fundamental_screen: List[str]
-    sector_group_leadership: List[str]
-    breakout_timing_signals: List[str]
+# Symbol extraction: $TSLA-style mentions and bare uppercase ticker-like words
+_DOLLAR_RE = re.compile(r'\$([A-Za-z]{2,5})\b')
+_TICKER_RE = re.compile(r'\b[A-Z]{2,5}\b')
 
+# Uppercase words that match _TICKER_RE but aren't tickers
+_COMMON_WORDS: frozenset[str] = frozenset({
+    'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HER', 'WAS', 'ONE', 'OUR', 'OUT',
+    'DAY', 'GET', 'HAS', 'HIM', 'HIS', 'HOW', 'ITS', 'MAY', 'NEW', 'NOW', 'OLD', 'SEE', 'TWO', 'WAY',
+    'WHO', 'BOY', 'DID', 'LET', 'PUT', 'SAY', 'SHE', 'TOO', 'USE', 'WHAT', 'WILL', 'WITH', 'HAVE',
+    'FROM', 'THEY', 'KNOW', 'WANT', 'BEEN', 'GOOD', 'MUCH', 'SOME', 'TIME', 'VERY', 'WHEN', 'COME',
+    'HERE', 'JUST', 'LIKE', 'LONG', 'MAKE', 'MANY', 'OVER', 'SUCH', 'TAKE', 'THAN', 'THEM', 'WELL',
+    'WERE', 'BUYS', 'THEN', 'BEST', 'LOOK', 'NICE', 'THINK', 'ABOUT', 'STOCK',
+    'STOCKS', 'BUY', 'SELL', 'HOLD', 'TRADE', 'INVEST', 'MARKET', 'PRICE', 'TODAY', 'ANALYSIS'
+})
 
-@dataclass
-class ZangerCriteriaChecklist:
-    """Checklist for Dan Zanger methodology criteria"""
-    technical_criteria: Dict[str, bool]
-    fundamental_criteria: Dict[str, bool]
-    risk_management: Dict[str, bool]
-    entry_criteria: Dict[str, bool]
-
+# Phrases marking a request for general stock recommendations
+_RECOMMEND_KEYWORDS = frozenset({
+    'good buys', 'recommendations', 'suggest', 'what to buy', 'best stocks',
+    'good buy', 'buys', 'stock picks', 'what stocks'
+})
+_RECOMMEND_RE = re.compile('|'.join(map(re.escape, sorted(_RECOMMEND_KEYWORDS))), re.IGNORECASE)
 
-@dataclass
-class OptionsOverlay:
-    """Options trading overlay for Zanger methodology"""
-    call_strategies: List[str]
-    put_strategies: List[str]
-    risk_defined_spreads: List[str]
-    earnings_plays: List[str]
+# JSON in Claude responses: a ```json fenced block (else see _extract_first_json)
+_JSON_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
 
+# Top-level fields every analysis response must include
+_REQUIRED_FIELDS: frozenset[str] = frozenset({
+    'analysis_summary',
+    'symbols_analyzed',
+    'current_data',
+    'zanger_analysis',
+    'recommendation',
+    'trading_details',
+    'risk_assessment'
+})
 
-class ZangerIntentProcessor:
-    """
-    Dan Zanger Intent Processor for analyzing stock questions and creating research plans
+def _extract_first_json(text: str) -> Optional[str]:
     """
+    Find the first complete JSON object in text with a single brace-matching pass
     
-    def __init__(self, api_key: Optional[str] = None):
-        """
-        Initialize the processor with Claude API configuration
-        
-        Args:
-            api_key: Anthropic API key. If None, expects ANTHROPIC_API_KEY environment variable
-        """
-        self.api_key = api_key or self._get_api_key()
-        self.api_url = "https://api.anthropic.com/v1/messages"
-        self.model = "claude-sonnet-4-20250514"
-        self.max_retries = 3
-        self.base_delay = 1.0
-        
-        # Setup requests session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+    Braces inside JSON strings (including escaped quotes) are ignored.
     
-    def _get_api_key(self) -> str:
-        """Get API key from environment or .env file"""
-        import os
-        from dotenv import load_dotenv
-        
-        # Load .env file from project root (searches up directory tree)
-        load_dotenv()
+    Args:
+        text: Text that may contain a JSON object
         
-        api_key = os.getenv('ANTHROPIC_API_KEY')
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY not found in environment or .env file")
-        return api_key
+    Returns:
+        The first balanced {...} substring, or None if there isn't one
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
     
-    def _get_system_message(self) -> str:
-        """
-        Get the enhanced Dan Zanger system message with real-time data requirements
-        
-        Returns:
-            System message string for Claude API
-        """
-        return """
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif char == '\\':
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Load the .env file from the project root (searches up directory tree), once per process"""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+# Enhanced Dan Zanger system message with real-time data requirements, built once
+_SYSTEM_MESSAGE: Final[str] = """
 You are a Dan Zanger trading methodology expert. You will be provided with LIVE market data fetched from real-time financial APIs.
 
 Use ONLY the provided live market data for your analysis. Do not use any training data or make assumptions about current prices, volumes, or fundamentals.
@@ -168,6 +183,97 @@ Response format (JSON only):
 
 Extract any stock symbols mentioned in the question. If no specific symbols, suggest 2-3 symbols that fit the current market environment and Zanger criteria. Ensure all JSON is properly formatted and valid.
 """
+
+# Analysis request: the user's question followed by the live market data
+_ENHANCED_QUESTION_TEMPLATE: Final[str] = """
+USER QUESTION: {user_question}
+
+LIVE MARKET DATA:
+{live_data}
+
+Based on the live market data provided above, analyze using Dan Zanger methodology:
+"""
+
+
+class StreamInterruptedError(Exception):
+    """A streamed Claude response failed mid-stream (e.g. overloaded_error) or ended early; safe to retry"""
+
+
+@dataclass
+class ZangerResearchPlan:
+    """Structured data class for Zanger research plan output"""
+    technical_pattern_analysis: List[str]
+    volume_verification: List[str]
+    zanger_fundamental_screen: List[str]
+    sector_group_leadership: List[str]
+    breakout_timing_signals: List[str]
+
+
+@dataclass
+class ZangerCriteriaChecklist:
+    """Checklist for Dan Zanger methodology criteria"""
+    technical_criteria: Dict[str, bool]
+    fundamental_criteria: Dict[str, bool]
+    risk_management: Dict[str, bool]
+    entry_criteria: Dict[str, bool]
+
+
+@dataclass
+class OptionsOverlay:
+    """Options trading overlay for Zanger methodology"""
+    call_strategies: List[str]
+    put_strategies: List[str]
+    risk_defined_spreads: List[str]
+    earnings_plays: List[str]
+
+
+class ZangerIntentProcessor:
+    """
+    Dan Zanger Intent Processor for analyzing stock questions and creating research plans
+    """
+    
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize the processor with Claude API configuration
+        
+        Args:
+            api_key: Anthropic API key. If None, expects ANTHROPIC_API_KEY environment variable
+        """
+        self.api_key = api_key or self._get_api_key()
+        self.api_url = "https://api.anthropic.com/v1/messages"
+        self.model = "claude-sonnet-4-20250514"
+        self.max_retries = 3
+        self.base_delay = 1.0
+        
+        # HTTP/2 client shared by every Claude call: concurrent requests multiplex
+        # over pooled keep-alive connections. The transport retries failed
+        # connects; 429/5xx responses are retried with backoff in _make_api_request.
+        self.client = httpx.Client(
+            timeout=30.0,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+            )
+        )
+    
+    def _get_api_key(self) -> str:
+        """Get API key from environment or .env file"""
+        _load_env()
+        
+        api_key = os.getenv('ANTHROPIC_API_KEY')
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY not found in environment or .env file")
+        return api_key
+    
+    def _get_system_message(self) -> str:
+        """
+        Get the enhanced Dan Zanger system message with real-time data requirements
+        
+        Returns:
+            System message string for Claude API
+        """
+        return _SYSTEM_MESSAGE
     
     def _extract_symbols_from_question(self, question: str) -> List[str]:
         """
@@ -186,30 +292,19 @@ Extract any stock symbols mentioned in the question. If no specific symbols, sug
         symbols = []
         
         # Pattern 1: Find $SYMBOL format
-        dollar_symbols = re.findall(r'\$([A-Za-z]{2,5})\b', question)
+        dollar_symbols = _DOLLAR_RE.findall(question)
         symbols.extend([s.upper() for s in dollar_symbols])
         
         # Pattern 2: Find standalone uppercase words (but only if they look like tickers)
         # Only match if the word is in a context that suggests it's a ticker
-        uppercase_pattern = r'\b[A-Z]{2,5}\b'
-        potential_symbols = re.findall(uppercase_pattern, question)
+        potential_symbols = _TICKER_RE.findall(question)
         
         # Much more aggressive filtering - only include if it's likely a real ticker
-        common_words = {
-            'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HER', 'WAS', 'ONE', 'OUR', 'OUT', 
-            'DAY', 'GET', 'HAS', 'HIM', 'HIS', 'HOW', 'ITS', 'MAY', 'NEW', 'NOW', 'OLD', 'SEE', 'TWO', 'WAY', 
-            'WHO', 'BOY', 'DID', 'LET', 'PUT', 'SAY', 'SHE', 'TOO', 'USE', 'WHAT', 'WILL', 'WITH', 'HAVE', 
-            'FROM', 'THEY', 'KNOW', 'WANT', 'BEEN', 'GOOD', 'MUCH', 'SOME', 'TIME', 'VERY', 'WHEN', 'COME', 
-            'HERE', 'JUST', 'LIKE', 'LONG', 'MAKE', 'MANY', 'OVER', 'SUCH', 'TAKE', 'THAN', 'THEM', 'WELL', 
-            'WERE', 'BUYS', 'THEN', 'BEST', 'GOOD', 'WHAT', 'SOME', 'LOOK', 'NICE', 'THINK', 'ABOUT', 'STOCK',
-            'STOCKS', 'BUY', 'SELL', 'HOLD', 'TRADE', 'INVEST', 'MARKET', 'PRICE', 'TODAY', 'ANALYSIS'
-        }
-        
-        likely_tickers = [s for s in potential_symbols if s not in common_words and len(s) >= 2]
+        likely_tickers = [s for s in potential_symbols if s not in _COMMON_WORDS]
         symbols.extend(likely_tickers)
         
-        # Remove duplicates
-        return list(set(symbols))
+        # Remove duplicates, keeping the order symbols appear in the question
+        return list(dict.fromkeys(symbols))
     
     def _get_zanger_stock_suggestions(self, user_question: str) -> List[str]:
         """
@@ -255,27 +350,27 @@ Just suggest 3 ticker symbols that would be worth analyzing. Respond with ONLY a
                 ]
             }
             
-            response = self.session.post(
+            response = self.client.post(
                 self.api_url,
                 headers=headers,
-                json=payload,
+                content=orjson.dumps(payload),
                 timeout=15
             )
             
             if response.status_code == 200:
-                api_response = response.json()
+                api_response = orjson.loads(response.content)
                 content = api_response.get('content', [])
                 if content and isinstance(content, list):
                     text_content = content[0].get('text', '')
                     
                     # Try to parse JSON from response
                     try:
-                        suggestions = json.loads(text_content.strip())
+                        suggestions = orjson.loads(text_content.strip())
                         if isinstance(suggestions, list):
                             return [s.upper() for s in suggestions if isinstance(s, str) and len(s) <= 5]
                     except:
                         # Fallback: extract symbols from text
-                        symbols = re.findall(r'\b[A-Z]{2,5}\b', text_content)
+                        symbols = _TICKER_RE.findall(text_content)
                         return symbols[:3]
             
         except Exception as e:
@@ -283,18 +378,20 @@ Just suggest 3 ticker symbols that would be worth analyzing. Respond with ONLY a
         
         return []  # Return empty if suggestions fail
     
-    def _make_api_request(self, user_question: str) -> Dict[str, Any]:
+    def _make_api_request(self, user_question: str, on_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
-        Make API request to Claude with exponential backoff retry logic
+        Make streaming API request to Claude with exponential backoff retry logic
         
         Args:
             user_question: The user's question to send to Claude
+            on_text: Optional callback receiving each text chunk as it arrives
             
         Returns:
-            API response dictionary
+            API response dictionary (same shape as a non-streaming response)
             
         Raises:
-            Exception: If all retry attempts fail
+            Exception: If all retry attempts fail, or the stream fails after
+                text was already passed to on_text
         """
         headers = {
             'anthropic-version': '2023-06-01',
@@ -305,6 +402,7 @@ Just suggest 3 ticker symbols that would be worth analyzing. Respond with ONLY a
         payload = {
             'model': self.model,
             'max_tokens': 4000,
+            'stream': True,
             'system': self._get_system_message(),
             'messages': [
                 {
@@ -314,30 +412,43 @@ Just suggest 3 ticker symbols that would be worth analyzing. Respond with ONLY a
             ]
         }
         
+        # Serialized once and reused across retries
+        body = orjson.dumps(payload)
         last_exception = None
         
+        # Text already passed to on_text can't be taken back, so once any has
+        # been emitted a failed stream is raised instead of restarted
+        emitted = False
+        
+        def emit(text: str) -> None:
+            nonlocal emitted
+            emitted = True
+            on_text(text)
+        
         for attempt in range(self.max_retries):
             try:
-                response = self.session.post(
+                with self.client.stream(
+                    'POST',
                     self.api_url,
                     headers=headers,
-                    json=payload,
+                    content=body,
                     timeout=30
-                )
-                
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 429:
-                    # Rate limit - wait longer
-                    delay = self.base_delay * (2 ** attempt) * 2
-                    time.sleep(delay)
-                    continue
-                else:
-                    response.raise_for_status()
+                ) as response:
+                    if response.status_code == 200:
+                        text = self._read_stream(response, emit if on_text else None)
+                        return {'content': [{'type': 'text', 'text': text}]}
+                    elif response.status_code == 429:
+                        # Rate limit - wait longer
+                        delay = self.base_delay * (2 ** attempt) * 2
+                        time.sleep(delay)
+                        continue
+                    else:
+                        response.read()
+                        response.raise_for_status()
                     
-            except requests.exceptions.RequestException as e:
+            except (httpx.HTTPError, StreamInterruptedError) as e:
                 last_exception = e
-                if attempt < self.max_retries - 1:
+                if attempt < self.max_retries - 1 and not emitted:
                     delay = self.base_delay * (2 ** attempt)
                     time.sleep(delay)
                     continue
@@ -347,6 +458,48 @@ Just suggest 3 ticker symbols that would be worth analyzing. Respond with ONLY a
         if last_exception:
             raise last_exception
     
+    def _read_stream(self, response: httpx.Response, on_text: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Accumulate the text of a streamed Claude response from its server-sent events
+        
+        Args:
+            response: Open streaming response
+            on_text: Optional callback receiving each text chunk as it arrives
+            
+        Returns:
+            Full response text
+            
+        Raises:
+            StreamInterruptedError: If the stream reports an error event (how
+                overload is signalled once streaming has started) or ends
+                without message_stop
+        """
+        text_parts = []
+        
+        for line in response.iter_lines():
+            # Event names are repeated in each data payload's "type"
+            if not line.startswith('data:'):
+                continue
+            
+            event = orjson.loads(line[len('data:'):])
+            event_type = event.get('type')
+            
+            if event_type == 'content_block_delta':
+                delta = event.get('delta', {})
+                if delta.get('type') == 'text_delta':
+                    text_parts.append(delta['text'])
+                    if on_text:
+                        on_text(delta['text'])
+            elif event_type == 'message_stop':
+                return ''.join(text_parts)
+            elif event_type == 'error':
+                error = event.get('error', {})
+                raise StreamInterruptedError(
+                    f"Streaming error from API ({error.get('type', 'unknown')}): {error.get('message', 'unknown error')}"
+                )
+        
+        raise StreamInterruptedError("Stream ended before message_stop")
+    
     def _parse_and_validate_response(self, api_response: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse Claude API response and validate JSON structure
@@ -372,35 +525,26 @@ Just suggest 3 ticker symbols that would be worth analyzing. Respond with ONLY a
                 raise ValueError("Invalid API response format: no text content found")
             
             # Parse JSON from the response
-            # Claude sometimes wraps JSON in markdown, so extract it
-            json_match = re.search(r'```json\s*(.*?)\s*```', text_content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
+            stripped = text_content.strip()
+            if stripped.startswith('{') and stripped.endswith('}'):
+                # Raw JSON (the usual case) - no regex scan needed
+                json_str = stripped
             else:
-                # Try to find JSON object in the response
-                json_match = re.search(r'\{.*\}', text_content, re.DOTALL)
+                # Claude sometimes wraps JSON in markdown, so extract it
+                json_match = _JSON_BLOCK_RE.search(stripped) if '```json' in stripped else None
                 if json_match:
-                    json_str = json_match.group(0)
+                    json_str = json_match.group(1)
                 else:
-                    json_str = text_content
+                    # Try to find JSON object in the response
+                    json_str = _extract_first_json(stripped) or stripped
             
             # Parse JSON
-            parsed_response = json.loads(json_str)
+            parsed_response = orjson.loads(json_str)
             
             # Validate required fields
-            required_fields = [
-                'analysis_summary',
-                'symbols_analyzed',
-                'current_data',
-                'zanger_analysis',
-                'recommendation',
-                'trading_details',
-                'risk_assessment'
-            ]
-            
-            for field in required_fields:
-                if field not in parsed_response:
-                    raise ValueError(f"Missing required field: {field}")
+            missing = _REQUIRED_FIELDS.difference(parsed_response)
+            if missing:
+                raise ValueError(f"Missing required fields: {sorted(missing)}")
             
             # Validate nested structures - more lenient for debugging
             recommendation = parsed_response.get('recommendation', {})
@@ -415,17 +559,18 @@ Just suggest 3 ticker symbols that would be worth analyzing. Respond with ONLY a
             
             return parsed_response
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in API response: {str(e)}")
         except KeyError as e:
             raise ValueError(f"Missing required field in API response: {str(e)}")
     
-    def process_intent(self, user_question: str) -> Dict[str, Any]:
+    def process_intent(self, user_question: str, on_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Main function to process user stock questions using Dan Zanger methodology
         
         Args:
             user_question: User's stock-related question
+            on_text: Optional callback receiving the analysis text as it streams in
             
         Returns:
             Structured response dictionary with research plan and analysis
@@ -446,42 +591,65 @@ Just suggest 3 ticker symbols that would be worth analyzing. Respond with ONLY a
             
             # Extract stock symbols and validate data availability
             symbols = self._extract_symbols_from_question(user_question)
-            live_data = ""
+            live_parts: List[str] = []
             failed_symbols = []
             successful_symbols = []
             
             # If no specific symbols mentioned, check if user wants general recommendations
-            # Check for various recommendation request patterns
-            recommendation_keywords = ['good buys', 'recommendations', 'suggest', 'what to buy', 'best stocks', 'good buy', 'buys', 'stock picks', 'what stocks']
-            is_recommendation_request = any(keyword in user_question.lower() for keyword in recommendation_keywords)
+            is_recommendation_request = _RECOMMEND_RE.search(user_question) is not None
             
             if not symbols and is_recommendation_request:
                 # First, ask LLM to suggest stocks based on current market conditions
                 suggested_symbols = self._get_zanger_stock_suggestions(user_question)
                 if suggested_symbols:
                     symbols = suggested_symbols[:3]  # Limit to 3 for efficiency
-                    live_data += "\n--- ANALYZING ZANGER-CRITERIA STOCKS ---\n"
+                    live_parts.append("\n--- ANALYZING ZANGER-CRITERIA STOCKS ---\n")
             
             if symbols:
-                for symbol in symbols[:3]:  # Limit to 3 symbols to avoid API limits
-                    try:
-                        data_result = get_live_stock_data(symbol)
-                        
-                        if data_result.get("success"):
-                            live_data += f"\n{data_result['data']}\n"
-                            successful_symbols.append(symbol)
-                        else:
-                            failed_symbols.append({
-                                "symbol": symbol,
-                                "error": data_result.get("error", "Unknown error")
-                            })
+                symbols = symbols[:3]  # Limit to 3 symbols to avoid API limits
+                
+                # Serve recently fetched symbols from the cache
+                data_results = {}
+                with _live_data_cache_lock:
+                    for symbol in symbols:
+                        cached_result = _live_data_cache.get(symbol.upper())
+                        if cached_result is not None:
+                            data_results[symbol] = cached_result
+                
+                # Fetch the rest concurrently; results are then handled in question order
+                symbols_to_fetch = [symbol for symbol in symbols if symbol not in data_results]
+                if symbols_to_fetch:
+                    with ThreadPoolExecutor(max_workers=len(symbols_to_fetch)) as executor:
+                        futures = {executor.submit(get_live_stock_data, symbol): symbol for symbol in symbols_to_fetch}
+                        for future in as_completed(futures):
+                            symbol = futures[future]
+                            try:
+                                data_results[symbol] = future.result()
+                            except Exception as e:
+                                data_results[symbol] = {
+                                    "success": False,
+                                    "error": f"Unexpected error: {str(e)}"
+                                }
+                                continue
                             
-                    except Exception as e:
+                            if data_results[symbol].get("success"):
+                                with _live_data_cache_lock:
+                                    _live_data_cache[symbol.upper()] = data_results[symbol]
+                
+                for symbol in symbols:
+                    data_result = data_results[symbol]
+                    
+                    if data_result.get("success"):
+                        live_parts.append(f"\n{data_result['data']}\n")
+                        successful_symbols.append(symbol)
+                    else:
                         failed_symbols.append({
                             "symbol": symbol,
-                            "error": f"Unexpected error: {str(e)}"
+                            "error": data_result.get("error", "Unknown error")
                         })
             
+            live_data = "".join(live_parts)
+            
             # Check if we have any usable market data
             if not live_data.strip() or (symbols and not successful_symbols):
                 # No data available - don't make LLM call
@@ -515,17 +683,10 @@ Just suggest 3 ticker symbols that would be worth analyzing. Respond with ONLY a
                 partial_failure_warning = f"\n\nNote: Could not retrieve data for {', '.join(failed_list)}. Analysis is based on available data only."
             
             # Enhance user question with live data
-            enhanced_question = f"""
-USER QUESTION: {user_question}
-
-LIVE MARKET DATA:
-{live_data}
-
-Based on the live market data provided above, analyze using Dan Zanger methodology:
-"""
+            enhanced_question = _ENHANCED_QUESTION_TEMPLATE.format(user_question=user_question, live_data=live_data)
             
             # Make API request with enhanced question including live data
-            api_response = self._make_api_request(enhanced_question)
+            api_response = self._make_api_request(enhanced_question, on_text)
             
             # Parse and validate response
             validated_response = self._parse_and_validate_response(api_response)
@@ -541,13 +702,13 @@ Based on the live market data provided above, analyze using Dan Zanger methodolo
             
             return validated_response
             
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             return {
                 'error': 'API request timed out - please try again',
                 'success': False,
                 'retry_recommended': True
             }
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, StreamInterruptedError) as e:
             return {
                 'error': f'API request failed: {str(e)}',
                 'success': False,
@@ -565,6 +726,25 @@ Based on the live market data provided above, analyze using Dan Zanger methodolo
                 'success': False,
                 'retry_recommended': False
             }
+    
+    async def process_intent_async(self, user_question: str) -> Dict[str, Any]:
+        """
+        Async version of process_intent for use from an event loop (e.g. an ASGI app)
+        
+        The blocking Claude and market data calls run on a worker thread, so
+        the event loop keeps serving other requests in the meantime.
+        
+        Args:
+            user_question: User's stock-related question
+            
+        Returns:
+            Structured response dictionary with research plan and analysis
+        """
+        return await asyncio.to_thread(self.process_intent, user_question)
+    
+    def close(self) -> None:
+        """Close the processor's HTTP client and its pooled connections"""
+        self.client.close()
 
 
 def create_processor(api_key: Optional[str] = None) -> ZangerIntentProcessor:
@@ -592,5 +772,31 @@ def process_intent(user_question: str, api_key: Optional[str] = None) -> Dict[st
         Structured response dictionary with research plan and analysis
     """
     processor = create_processor(api_key)
-    return processor.process_intent(user_question)
+    try:
+        return processor.process_intent(user_question)
+    finally:
+        processor.close()
+
 
+async def process_intent_async(user_question: str, api_key: Optional[str] = None,
+                               processor: Optional[ZangerIntentProcessor] = None) -> Dict[str, Any]:
+    """
+    Async convenience function to process user intent with Dan Zanger methodology
+    
+    Args:
+        user_question: User's stock-related question
+        api_key: Optional Anthropic API key (ignored when processor is given)
+        processor: Optional processor to reuse, keeping its connection pool warm
+            across calls; otherwise a temporary one is created and closed
+        
+    Returns:
+        Structured response dictionary with research plan and analysis
+    """
+    if processor is not None:
+        return await processor.process_intent_async(user_question)
+    
+    processor = create_processor(api_key)
+    try:
+        return await processor.process_intent_async(user_question)
+    finally:
+        processor.close()
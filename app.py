@@ -1,14 +1,51 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
 from flask_cors import CORS
+from cachetools import TTLCache
 import agent.zanger_intent_processor as zp
 import os
-import anthropic
+import json
+import queue
+import secrets
+import threading
 
 app = Flask(__name__)
 CORS(app)
 
-# Store API key per session (in production, use proper session management)
-active_api_keys = {}
+# Store API key per session token issued at login (in production, use proper session management)
+# Bounded, and entries expire an hour after login
+active_api_keys = TTLCache(maxsize=10_000, ttl=3600)
+_keys_lock = threading.Lock()
+
+# API keys that passed the login check recently; repeat logins (e.g. page
+# refreshes) skip the round trip to Anthropic
+_validated_keys = TTLCache(maxsize=10_000, ttl=3600)
+
+def get_session_token():
+    """Get the session token from the request's "Authorization: Bearer <token>" header"""
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    if scheme.lower() != 'bearer':
+        return None
+    return token.strip() or None
+
+def get_session_api_key():
+    """Get the API key stored for the request's session token, or None if not logged in"""
+    token = get_session_token()
+    if not token:
+        return None
+    with _keys_lock:
+        return active_api_keys.get(token)
+
+# One processor per API key so its HTTP connection pool is reused across chats
+processors = TTLCache(maxsize=1000, ttl=3600)
+_processors_lock = threading.Lock()
+
+def get_processor(api_key):
+    """Get the cached ZangerIntentProcessor for an API key, creating it if needed"""
+    with _processors_lock:
+        processor = processors.get(api_key)
+        if processor is None:
+            processor = processors[api_key] = zp.create_processor(api_key=api_key)
+        return processor
 
 @app.route('/')
 def serve_frontend():
@@ -30,21 +67,28 @@ def login():
         if not api_key.startswith('sk-ant-api'):
             return jsonify({'error': 'Invalid API key format'}), 400
         
-        # Test the API key by making a simple request
+        # Test the API key unless it was validated recently
         try:
-            client = anthropic.Anthropic(api_key=api_key)
-            # Test with a minimal request
-            response = client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=10,
-                messages=[{"role": "user", "content": "Hi"}]
-            )
+            with _keys_lock:
+                is_validated = api_key in _validated_keys
+            
+            if not is_validated:
+                # Imported here rather than at startup (anthropic is slow to import)
+                import anthropic
+                
+                # Listing models authenticates the key without generating any tokens
+                client = anthropic.Anthropic(api_key=api_key)
+                client.models.list(limit=1)
+                with _keys_lock:
+                    _validated_keys[api_key] = True
             
-            # Store the API key for this session
-            session_id = request.remote_addr  # Simple session ID based on IP
-            active_api_keys[session_id] = api_key
+            # Store the API key under a new session token; the client sends it back
+            # as "Authorization: Bearer <token>"
+            token = secrets.token_urlsafe(32)
+            with _keys_lock:
+                active_api_keys[token] = api_key
             
-            return jsonify({'success': True, 'message': 'API key validated successfully'})
+            return jsonify({'success': True, 'message': 'API key validated successfully', 'token': token})
             
         except Exception as e:
             return jsonify({'error': 'Invalid API key or authentication failed'}), 401
@@ -55,8 +99,7 @@ def login():
 @app.route('/api/chat', methods=['POST'])
 def chat():
     try:
-        session_id = request.remote_addr
-        api_key = active_api_keys.get(session_id)
+        api_key = get_session_api_key()
         
         if not api_key:
             return jsonify({'error': 'Not authenticated. Please login first.'}), 401
@@ -67,11 +110,8 @@ def chat():
         if not user_message:
             return jsonify({'error': 'Message is required'}), 400
         
-        # Set the API key for this request
-        os.environ['ANTHROPIC_API_KEY'] = api_key
-        
         # Process with enhanced Zanger methodology
-        result = zp.process_intent(user_message)
+        result = get_processor(api_key).process_intent(user_message)
         
         if not result.get('success', False):
             return jsonify({'error': result.get('error', 'Analysis failed')}), 500
@@ -84,11 +124,59 @@ def chat():
     except Exception as e:
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
+@app.route('/api/chat/stream', methods=['POST'])
+def chat_stream():
+    """
+    Streaming variant of /api/chat
+    
+    Responds with newline-delimited JSON events: {"type": "delta", "text": ...}
+    for each chunk of the analysis as Claude generates it, then a final
+    {"type": "result", "success": true, "analysis": ...} or {"type": "error", "error": ...}.
+    """
+    try:
+        api_key = get_session_api_key()
+        
+        if not api_key:
+            return jsonify({'error': 'Not authenticated. Please login first.'}), 401
+        
+        data = request.get_json()
+        user_message = data.get('message', '').strip()
+        
+        if not user_message:
+            return jsonify({'error': 'Message is required'}), 400
+        
+        processor = get_processor(api_key)
+    except Exception as e:
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+    
+    events = queue.Queue()
+    
+    def run_analysis():
+        try:
+            result = processor.process_intent(
+                user_message,
+                on_text=lambda text: events.put({'type': 'delta', 'text': text})
+            )
+            if result.get('success', False):
+                events.put({'type': 'result', 'success': True, 'analysis': result})
+            else:
+                events.put({'type': 'error', 'error': result.get('error', 'Analysis failed')})
+        except Exception as e:
+            events.put({'type': 'error', 'error': f'Server error: {str(e)}'})
+        finally:
+            events.put(None)
+    
+    def generate():
+        threading.Thread(target=run_analysis, daemon=True).start()
+        while (event := events.get()) is not None:
+            yield json.dumps(event) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @app.route('/api/stock-data', methods=['POST'])
 def get_stock_data():
     try:
-        session_id = request.remote_addr
-        api_key = active_api_keys.get(session_id)
+        api_key = get_session_api_key()
         
         if not api_key:
             return jsonify({'error': 'Not authenticated. Please login first.'}), 401
@@ -100,9 +188,8 @@ def get_stock_data():
             return jsonify({'error': 'Stock symbol is required'}), 400
         
         # Import and use the financial data service
-        from agent.financial_data import FinancialDataService
-        service = FinancialDataService()
-        stock_data = service.get_stock_data(symbol)
+        from agent.financial_data import get_default_service
+        stock_data = get_default_service().get_stock_data(symbol)
         
         if 'error' in stock_data:
             return jsonify({'success': False, 'error': stock_data['error']}), 400
@@ -118,12 +205,25 @@ def get_stock_data():
 @app.route('/api/logout', methods=['POST'])
 def logout():
     try:
-        session_id = request.remote_addr
-        if session_id in active_api_keys:
-            del active_api_keys[session_id]
+        token = get_session_token()
+        if token:
+            with _keys_lock:
+                active_api_keys.pop(token, None)
         return jsonify({'success': True, 'message': 'Logged out successfully'})
     except Exception as e:
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
+def warm_watchlist():
+    """Pre-fetch stock data for the comma-separated STOCK_WATCHLIST env var in the background"""
+    symbols = [s.strip().upper() for s in os.getenv('STOCK_WATCHLIST', '').split(',') if s.strip()]
+    if not symbols:
+        return
+    
+    from agent.financial_data import get_default_service
+    threading.Thread(target=get_default_service().warm_cache, args=(symbols,), daemon=True).start()
+
+warm_watchlist()
+
 if __name__ == '__main__':
-    app.run(debug=True, port=5001)
\ No newline at end of file
+    # Development server only; production runs under gunicorn (see wsgi.py)
+    app.run(debug=os.getenv('FLASK_DEBUG', '').lower() in ('1', 'true'), port=5001)
\ No newline at end of file
@@ -1,6 +1,7 @@
 class TradingAgentUI {
     constructor() {
         this.isLoggedIn = false;
+        this.authToken = null;
         this.isProcessing = false;
         this.initializeLoginListeners();
         this.savedStocks = this.loadSavedStocks();
@@ -66,6 +67,7 @@ class TradingAgentUI {
             
             if (data.success) {
                 this.isLoggedIn = true;
+                this.authToken = data.token;
                 this.showMainApp();
                 this.initializeApp();
             } else {
@@ -81,6 +83,13 @@ class TradingAgentUI {
         }
     }
     
+    authHeaders() {
+        return {
+            'Content-Type': 'application/json',
+            'Authorization': `Bearer ${this.authToken}`,
+        };
+    }
+    
     showLoginError(message) {
         const loginError = document.getElementById('loginError');
         loginError.textContent = message;
@@ -94,8 +103,9 @@ class TradingAgentUI {
     
     async handleLogout() {
         try {
-            await fetch('/api/logout', { method: 'POST' });
+            await fetch('/api/logout', { method: 'POST', headers: this.authHeaders() });
             this.isLoggedIn = false;
+            this.authToken = null;
             document.getElementById('loginContainer').style.display = 'flex';
             document.getElementById('mainContainer').style.display = 'none';
             document.getElementById('apiKeyInput').value = '';
@@ -151,9 +161,7 @@ class TradingAgentUI {
         try {
             const response = await fetch('/api/chat', {
                 method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
+                headers: this.authHeaders(),
                 body: JSON.stringify({ message })
             });
             
@@ -399,9 +407,7 @@ class TradingAgentUI {
         try {
             const response = await fetch('/api/stock-data', {
                 method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
+                headers: this.authHeaders(),
                 body: JSON.stringify({ symbol })
             });
             
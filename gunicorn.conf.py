@@ -0,0 +1,20 @@
+"""
+Gunicorn settings for serving wsgi:app
+
+Each chat request mostly waits on Claude and the market data APIs, so a
+threaded worker overlaps many of them within one process.
+"""
+
+import os
+
+# Loopback only by default (like the dev server); set BIND=0.0.0.0:5001 to expose it
+bind = os.getenv('BIND', '127.0.0.1:5001')
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '32'))
+
+# Login sessions and processors live in process memory, so keep a single
+# worker unless sessions are moved to a shared store
+workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+
+# Streaming analyses can take longer than the default 30s
+timeout = 120
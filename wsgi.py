@@ -0,0 +1,11 @@
+"""
+WSGI entry point
+
+Run with gunicorn (settings in gunicorn.conf.py):
+    gunicorn wsgi:app
+"""
+
+from app import app
+
+if __name__ == '__main__':
+    app.run(port=5001)